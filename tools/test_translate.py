@@ -0,0 +1,176 @@
+"""
+Tests for translate.py (output writing, checkpoints, circuit breaker).
+
+Run from the repo root:
+  python -m unittest discover -s tools
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import translate  # noqa: E402
+
+
+SOURCE = {
+    "@@locale": "en",
+    "greeting": "Hello {name}",
+    "@greeting": {"placeholders": {"name": {}}},
+    "farewell": "Goodbye for now",
+    "@farewell": {"description": "Shown when leaving"},
+    "search": "Search contacts",
+    "@search": {"description": "Search field hint"},
+    "voltage": "Voltage is {value}",
+    "@voltage": {"placeholders": {"value": {}}},
+    "settings": "Open the settings",
+    "@settings": {"description": "Settings button"},
+}
+KEYS = [k for k in SOURCE if not k.startswith("@")]
+
+
+class Interrupted(BaseException):
+    """Stands in for Ctrl+C; not an Exception, so the retry and fallback paths don't swallow it."""
+
+
+def fake_generate(fail_after=None):
+    calls = []
+
+    async def generate(cfg, prompt, max_tokens=None, timeout_s=None):
+        if max_tokens is not None:  # prompt cache warm-up
+            return ""
+        if fail_after is not None and len(calls) >= fail_after:
+            # Let the results that already came back be recorded first, as with a slow request
+            await asyncio.sleep(0.05)
+            raise Interrupted()
+        text = prompt.rsplit("\n\n\n", 1)[-1]
+        calls.append(text)
+        return f"ES {text}"
+
+    return generate
+
+
+def make_args(**overrides):
+    args = dict(
+        fallback_model=None,
+        concurrency=1,
+        batch_size=1,
+        retries=0,
+        backoff=0.0,
+        progress_every=1000,
+        checkpoint_every=2,
+        dry_run=False,
+    )
+    args.update(overrides)
+    return SimpleNamespace(**args)
+
+
+class TranslateLocaleTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.out_path = os.path.join(tmp.name, "app_es.arb")
+        self.cfg = translate.OllamaConfig(host="http://127.0.0.1:9", model="test", timeout_s=1.0, temperature=0.0)
+
+    async def run_locale(self, target_data, missing_only, fail_after=None, source=SOURCE):
+        buckets = translate.classify(source, target_data, "es", missing_only)
+        with mock.patch.object(translate, "ollama_generate", fake_generate(fail_after)), \
+                mock.patch("builtins.print"):
+            return await translate.translate_locale(
+                source_data=source,
+                target_data=target_data,
+                target_locale="es",
+                target_lang="Spanish",
+                target_code="es",
+                out_path=self.out_path,
+                cfg=self.cfg,
+                fallback_cfg=None,
+                args=make_args(),
+                buckets=buckets,
+            )
+
+    async def test_missing_keys_without_model_work_are_written(self):
+        target = {"@@locale": "es", "a": "Hola"}
+        translate.write_arb(self.out_path, target)
+
+        await self.run_locale(target, missing_only=True, source={"a": "Hello", "b": "{count}", "c": "42%"})
+
+        self.assertEqual(translate.read_json_file(self.out_path), {"@@locale": "es", "a": "Hola", "b": "{count}", "c": "42%"})
+
+    async def test_interrupted_fresh_run_resumes_with_missing_only(self):
+        with self.assertRaises(Interrupted):
+            await self.run_locale({}, missing_only=False, fail_after=3)
+
+        checkpoint = translate.read_json_file(self.out_path)
+        done = [k for k in KEYS if k in checkpoint]
+        self.assertEqual(len(done), 2)
+        for k in done:
+            self.assertEqual(checkpoint[k], f"ES {SOURCE[k]}")
+            self.assertEqual(checkpoint[f"@{k}"], SOURCE[f"@{k}"])
+
+        await self.run_locale(translate.read_json_file(self.out_path), missing_only=True)
+
+        final = translate.read_json_file(self.out_path)
+        for k in KEYS:
+            self.assertEqual(final[k], f"ES {SOURCE[k]}")
+            self.assertEqual(final[f"@{k}"], SOURCE[f"@{k}"])
+
+    async def test_interrupted_full_run_keeps_existing_translations(self):
+        existing = {"@@locale": "es", **{k: f"Viejo {k}" for k in KEYS}, **{f"@{k}": SOURCE[f"@{k}"] for k in KEYS}}
+        translate.write_arb(self.out_path, existing)
+
+        with self.assertRaises(Interrupted):
+            await self.run_locale({}, missing_only=False, fail_after=3)
+
+        checkpoint = translate.read_json_file(self.out_path)
+        self.assertEqual(set(checkpoint), set(existing))
+        updated = [k for k in KEYS if checkpoint[k] == f"ES {SOURCE[k]}"]
+        self.assertEqual(len(updated), 2)
+        for k in KEYS:
+            if k not in updated:
+                self.assertEqual(checkpoint[k], existing[k])
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def trip(self, breaker):
+        with mock.patch("builtins.print"):
+            for _ in range(breaker.threshold):
+                breaker.before_request()
+                breaker.record_failure()
+
+    def test_open_breaker_fails_fast(self):
+        breaker = translate.CircuitBreaker(threshold=3, cooldown_s=60.0)
+        self.trip(breaker)
+        with self.assertRaises(translate.CircuitOpenError):
+            breaker.before_request()
+
+    def test_single_probe_after_cooldown(self):
+        breaker = translate.CircuitBreaker(threshold=3, cooldown_s=0.0)
+        self.trip(breaker)
+
+        breaker.before_request()  # the probe
+        with self.assertRaises(translate.CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success()
+        breaker.before_request()
+        breaker.before_request()
+
+    def test_failed_probe_reopens(self):
+        breaker = translate.CircuitBreaker(threshold=3, cooldown_s=0.0)
+        self.trip(breaker)
+
+        breaker.before_request()
+        breaker.cooldown_s = 60.0
+        breaker.record_failure()
+        with self.assertRaises(translate.CircuitOpenError):
+            breaker.before_request()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """
-translate_arb_with_translategemma.py
+translate.py
 
 Translates ARB/JSON localization files using TranslateGemma via Ollama.
 Preserves placeholders like {deviceName} and ICU plural/select formats.
+This is the only ARB translation script; validated translations are cached
+in .translate_cache.sqlite and reused across runs and locales.
 
 Usage:
   # Translate all strings:
@@ -17,28 +19,90 @@ Usage:
 """
 
 import argparse
+import array
+import asyncio
+import functools
+import hashlib
+import http.client
 import json
 import os
+import random
 import re
+import sqlite3
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple, Optional
-from urllib import request
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Tuple, Optional, Union
+from urllib.parse import urlsplit
+
+try:
+    import orjson  # optional, much faster JSON encode/decode
+except ImportError:
+    orjson = None
 
 
 # Placeholder patterns
 SIMPLE_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
 ICU_VAR_RE = re.compile(r"\{(\w+)\s*,\s*(?:plural|select|selectordinal)\s*,", re.IGNORECASE)
+# One left-to-right scan: ICU header name | simple placeholder name | ICU text-form label (=1, other, ...) before "{"
+PLACEHOLDER_SCAN_RE = re.compile(
+    r"\{(?:(?P<icu>\w+)\s*,\s*(?:plural|select|selectordinal)\s*,|(?P<ph>\w+)\})"
+    r"|(?P<form>(?:=\d+|zero|one|two|few|many|other)\s*(?=\{))",
+    re.IGNORECASE,
+)
 
+# At least one word-like run of letters, i.e. something worth sending to the model
+TRANSLATABLE_TEXT_RE = re.compile(r"[A-Za-z]{2,}")
 
-@dataclass
+# Numbered segment markers used by batched prompts (<<<1>>> text)
+BATCH_ITEM_RE = re.compile(r"<<<(\d+)>>>\s*(.*?)(?=<<<\d+>>>|\Z)", re.S)
+
+
+@dataclass(frozen=True, slots=True)
 class OllamaConfig:
     host: str
     model: str
     timeout_s: float
     temperature: float
+    keep_alive: Union[str, int] = "30m"  # How long Ollama keeps the model loaded after a request
+    url: str = field(init=False)  # /api/generate endpoint, derived from host once
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "url", self.host.rstrip("/") + "/api/generate")
+
+
+def parse_keep_alive(value: str) -> Union[str, int]:
+    """Ollama takes durations like "30m" as strings but plain seconds (e.g. -1 = forever) as numbers."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def ollama_configs(args) -> Tuple[OllamaConfig, Optional[OllamaConfig]]:
+    """Build the primary and optional fallback model configs from CLI args."""
+    cfg = OllamaConfig(
+        host=args.host,
+        model=args.model,
+        timeout_s=args.timeout,
+        temperature=args.temperature,
+        keep_alive=args.keep_alive,
+    )
+
+    fallback_cfg = None
+    if args.fallback_model:
+        fallback_cfg = OllamaConfig(
+            host=args.host,
+            model=args.fallback_model,
+            timeout_s=args.timeout,
+            temperature=args.temperature,
+            keep_alive=args.keep_alive,
+        )
+
+    return cfg, fallback_cfg
 
 
 # Language mapping (locale_code -> (language_name, translategemma_code))
@@ -75,8 +139,15 @@ LOCALE_MAP = {
     "id": ("Indonesian", "id"),
 }
 
+# Progress output: minimum seconds between lines, and completions used for the ETA rate
+PROGRESS_MIN_INTERVAL_S = 0.5
+PROGRESS_RATE_WINDOW = 50
+
+# Suffix of the temp file used for checkpoints and atomic writes
+PARTIAL_SUFFIX = ".partial"
+
 # Keys to skip translation
-SKIP_KEYS = {"appTitle"}
+SKIP_KEYS = frozenset({"appTitle"})
 
 # Manual translations for complex strings
 MANUAL_TRANSLATIONS: Dict[str, Dict[str, str]] = {
@@ -100,61 +171,290 @@ MANUAL_TRANSLATIONS: Dict[str, Dict[str, str]] = {
     },
 }
 
+# (key, locale) -> manual translation, for a single lookup per entry
+MANUAL_TRANSLATIONS_FLAT: Dict[Tuple[str, str], str] = {
+    (key, locale): text
+    for key, by_locale in MANUAL_TRANSLATIONS.items()
+    for locale, text in by_locale.items()
+}
+
+
+def json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def json_dumps_arb(data: Dict[str, Any]) -> bytes:
+    """Serialize ARB data as 2-space indented UTF-8 with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+def read_json_file(path: str) -> Any:
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
+class TranslationCache:
+    """Persistent SQLite cache of validated translations, shared across runs and locales."""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, target_lang: str, target_code: str, text: str) -> str:
+        # Both language name and code go into the prompt (pt and pt-BR share the code "pt")
+        return hashlib.sha256(f"{model}\x00{target_lang}\x00{target_code}\x00{text}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)", (key, value))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Per-thread keep-alive connections, keyed by (scheme, netloc)
+_HTTP_LOCAL = threading.local()
+
 
-def http_post_json(url: str, payload: Dict[str, Any], timeout_s: float) -> Dict[str, Any]:
-    data = json.dumps(payload).encode("utf-8")
-    req = request.Request(url, data=data, headers={"Content-Type": "application/json"}, method="POST")
-    with request.urlopen(req, timeout=timeout_s) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+@functools.lru_cache(maxsize=None)
+def _proxy_for(scheme: str, host: str) -> Optional[str]:
+    """Proxy from HTTP_PROXY/HTTPS_PROXY for this scheme, or None if unset or the host matches NO_PROXY."""
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    return proxy if "://" in proxy else f"http://{proxy}"
 
 
-def ollama_generate(cfg: OllamaConfig, prompt: str) -> str:
-    url = cfg.host.rstrip("/") + "/api/generate"
+def _http_connection(scheme: str, netloc: str, timeout_s: float) -> http.client.HTTPConnection:
+    conns: Dict[Tuple[str, str], http.client.HTTPConnection] = _HTTP_LOCAL.__dict__.setdefault("conns", {})
+    conn = conns.get((scheme, netloc))
+    if conn is None:
+        proxy = _proxy_for(scheme, urlsplit(f"//{netloc}").hostname or "")
+        if proxy is None:
+            conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = conn_cls(netloc, timeout=timeout_s)
+        else:
+            proxy_parts = urlsplit(proxy)
+            if scheme == "https":
+                # TLS to the target through a CONNECT tunnel
+                conn = http.client.HTTPSConnection(proxy_parts.netloc, timeout=timeout_s)
+                conn.set_tunnel(netloc)
+            else:
+                conn_cls = http.client.HTTPSConnection if proxy_parts.scheme == "https" else http.client.HTTPConnection
+                conn = conn_cls(proxy_parts.netloc, timeout=timeout_s)
+        conns[(scheme, netloc)] = conn
+    conn.timeout = timeout_s
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout_s)
+    return conn
+
+
+def _drop_http_connection(scheme: str, netloc: str) -> None:
+    conn = _HTTP_LOCAL.__dict__.get("conns", {}).pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def http_post_ndjson(url: str, payload: Dict[str, Any], timeout_s: float) -> List[Dict[str, Any]]:
+    """POST JSON and decode the newline-delimited JSON response line by line, up to the first "done" object."""
+    parts = urlsplit(url)
+    path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    if parts.scheme == "http" and _proxy_for(parts.scheme, parts.hostname or ""):
+        # Plain HTTP proxies expect the absolute URL in the request line
+        path = url
+    data = json_dumps(payload)
+    headers = {"Content-Type": "application/json"}
+    deadline = time.monotonic() + timeout_s
+
+    for attempt in range(2):
+        conn = _http_connection(parts.scheme, parts.netloc, timeout_s)
+        reused = conn.sock is not None
+        objs: List[Dict[str, Any]] = []
+        try:
+            conn.request("POST", path, body=data, headers=headers)
+            resp = conn.getresponse()
+            if resp.status >= 400:
+                body = resp.read()
+                raise RuntimeError(f"HTTP {resp.status} {resp.reason}: {body[:200].decode('utf-8', 'replace')}")
+            for line in resp:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Request timed out after {timeout_s:g}s")
+                if line.strip():
+                    objs.append(json_loads(line))
+                    if objs[-1].get("done"):
+                        break
+            # Drain the rest so the connection can be reused
+            resp.read()
+        except (ConnectionResetError, BrokenPipeError):
+            # The server may have closed an idle keep-alive socket; reconnect once
+            _drop_http_connection(parts.scheme, parts.netloc)
+            if reused and attempt == 0:
+                continue
+            raise
+        except (OSError, http.client.HTTPException, ValueError):
+            _drop_http_connection(parts.scheme, parts.netloc)
+            raise
+        return objs
+
+    raise RuntimeError("unreachable")
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Fails requests fast once too many consecutive requests have failed, then lets one probe through after a cooldown."""
+
+    def __init__(self, threshold: int, cooldown_s: float):
+        self.threshold = threshold
+        self.cooldown_s = cooldown_s
+        self.fail_count = 0
+        self.is_open = False
+        self.open_until = 0.0
+        self.probing = False
+
+    def before_request(self) -> None:
+        """Raise instead of sending while open; once the cooldown is over, the first caller becomes the probe."""
+        if not self.is_open:
+            return
+        if self.probing or time.monotonic() < self.open_until:
+            raise CircuitOpenError("Skipped: Ollama requests keep failing (circuit breaker open)")
+        self.probing = True
+
+    def record_success(self) -> None:
+        self.fail_count = 0
+        self.is_open = False
+        self.probing = False
+
+    def record_failure(self) -> None:
+        if self.probing:
+            # The probe failed: stay open for another cooldown
+            self.probing = False
+            self._open()
+            return
+        if self.is_open:
+            return
+        self.fail_count += 1
+        if self.fail_count >= self.threshold:
+            print(f"{self.fail_count} consecutive request failures, failing requests fast for {self.cooldown_s:g}s", file=sys.stderr)
+            self._open()
+
+    def _open(self) -> None:
+        self.is_open = True
+        self.open_until = time.monotonic() + self.cooldown_s
+        self.fail_count = 0
+
+
+# Shared by all requests so an overloaded or unreachable server fails everyone fast at once
+BREAKER = CircuitBreaker(threshold=5, cooldown_s=5.0)
+
+
+def backoff_delay(backoff_s: float, attempt: int) -> float:
+    """Exponential backoff with jitter, so retries from concurrent workers spread out."""
+    return backoff_s * 2 ** attempt * random.uniform(0.5, 1.5)
+
+
+async def ollama_generate(
+    cfg: OllamaConfig,
+    prompt: str,
+    max_tokens: Optional[int] = None,
+    timeout_s: Optional[float] = None,
+) -> str:
+    options: Dict[str, Any] = {"temperature": cfg.temperature}
+    if max_tokens is not None:
+        options["num_predict"] = max_tokens
     payload = {
         "model": cfg.model,
         "prompt": prompt,
-        "stream": False,
-        "options": {"temperature": cfg.temperature},
+        "stream": True,
+        "keep_alive": cfg.keep_alive,
+        "options": options,
     }
-    resp = http_post_json(url, payload, cfg.timeout_s)
-    return resp.get("response", "").strip()
+    BREAKER.before_request()
+    try:
+        # Blocking keep-alive request on a worker thread, so other requests keep going meanwhile
+        objs = await asyncio.to_thread(http_post_ndjson, cfg.url, payload, timeout_s if timeout_s is not None else cfg.timeout_s)
+    except BaseException:
+        # Cancellation counts too, so a cancelled probe can't leave the breaker waiting on it forever
+        BREAKER.record_failure()
+        raise
+    BREAKER.record_success()
+
+    buf: List[str] = []
+    for obj in objs:
+        if obj.get("error"):
+            raise RuntimeError(obj["error"])
+        buf.append(obj.get("response", ""))
+    return "".join(buf).strip()
 
 
 def extract_placeholder_names(s: str) -> List[str]:
     """Extract placeholder variable names from string."""
-    names = set()
+    if "{" not in s:
+        return []
 
-    # Get ICU variable names
-    for m in ICU_VAR_RE.finditer(s):
-        names.add(m.group(1))
+    names = set()
+    form_end = -1
+
+    for m in PLACEHOLDER_SCAN_RE.finditer(s):
+        kind = m.lastgroup
+        if kind == "icu":
+            names.add(m.group("icu"))
+        elif kind == "ph":
+            # Skip text forms inside ICU (=X{...} or other{...}) that happen to be a single word
+            if m.start() != form_end:
+                names.add(m.group("ph"))
+        else:
+            form_end = m.end()
 
-    # Get simple placeholders (excluding ICU text forms)
-    for m in SIMPLE_PLACEHOLDER_RE.finditer(s):
-        name = m.group(1)
-        pos = m.start()
-        rest = s[pos:]
+    return sorted(names)
 
-        # Skip if this is part of an ICU block
-        if re.match(r"\{\w+\s*,\s*(?:plural|select|selectordinal)", rest, re.IGNORECASE):
-            continue
 
-        # Skip if this is a text form inside ICU (preceded by =X{ or other{)
-        before = s[:pos]
-        if re.search(r"(?:=\d+|zero|one|two|few|many|other)\s*$", before, re.IGNORECASE):
-            continue
+def has_icu_block(s: str) -> bool:
+    """Check if string contains ICU plural/select block."""
+    # Every ICU header contains a comma, so most plain strings are ruled out without the regex
+    return "," in s and bool(ICU_VAR_RE.search(s))
 
-        names.add(name)
 
-    return sorted(names)
+def is_trivial(s: str) -> bool:
+    """Check if string has no translatable text once placeholders are removed (numbers, symbols, {count})."""
+    return not TRANSLATABLE_TEXT_RE.search(SIMPLE_PLACEHOLDER_RE.sub("", ICU_VAR_RE.sub("", s)))
 
 
-def has_icu_block(s: str) -> bool:
-    """Check if string contains ICU plural/select block."""
-    return bool(ICU_VAR_RE.search(s))
+@functools.lru_cache(maxsize=64)
+def prompt_preamble(target_lang: str, target_code: str) -> str:
+    """Constant head of every prompt for a locale; keeping it byte-identical lets Ollama reuse its KV cache."""
+    return (
+        f"You are a professional English (en) to {target_lang} ({target_code}) translator. Your goal is to accurately convey the meaning and nuances of the original English text while adhering to {target_lang} grammar, vocabulary, and cultural sensitivities.\n"
+        f"Produce only the {target_lang} translation, without any additional explanations or commentary."
+    )
 
 
-def build_prompt(text: str, target_lang: str, target_code: str, placeholder_names: List[str], has_icu: bool) -> str:
-    """Build TranslateGemma-compatible prompt with placeholder preservation instructions."""
+@functools.lru_cache(maxsize=2048)
+def prompt_head(target_lang: str, target_code: str, placeholder_names: Tuple[str, ...], has_icu: bool) -> str:
+    """Everything in a single-string prompt before the text itself; shared by strings with the same placeholders."""
     # Build instructions for placeholder preservation
     instructions = []
     if placeholder_names:
@@ -168,12 +468,56 @@ def build_prompt(text: str, target_lang: str, target_code: str, placeholder_name
     separator = "\n" if instruction_text else ""
 
     # TranslateGemma expects this exact format (note the two blank lines before text)
-    return f"""You are a professional English (en) to {target_lang} ({target_code}) translator. Your goal is to accurately convey the meaning and nuances of the original English text while adhering to {target_lang} grammar, vocabulary, and cultural sensitivities.
-Produce only the {target_lang} translation, without any additional explanations or commentary.{separator}{instruction_text}
+    return f"""{prompt_preamble(target_lang, target_code)}{separator}{instruction_text}
+Please translate the following English text into {target_lang}:
+
+
+"""
+
+
+def build_prompt(text: str, target_lang: str, target_code: str, placeholder_names: List[str], has_icu: bool) -> str:
+    """Build TranslateGemma-compatible prompt with placeholder preservation instructions."""
+    return prompt_head(target_lang, target_code, tuple(placeholder_names), has_icu) + text
+
+
+def build_batch_prompt(texts: List[str], target_lang: str, target_code: str) -> str:
+    """Build a prompt that translates several strings at once as numbered <<<i>>> segments."""
+    instructions = [
+        f"The text below contains {len(texts)} numbered segments, each starting with a marker like <<<1>>>. "
+        "Translate each segment independently and output exactly one `<<<i>>> translation` entry per segment, "
+        "keeping every marker unchanged and in the same order.",
+        "CRITICAL: Keep all placeholders in curly braces (e.g. {name}) EXACTLY as they appear.",
+    ]
+    if any(has_icu_block(t) for t in texts):
+        instructions.append("CRITICAL: Preserve ICU message format structure (plural, select, =0, =1, other, etc.). Only translate the text inside the forms.")
+
+    instruction_text = "\n".join(instructions)
+    segments = "\n".join(f"<<<{i}>>> {t}" for i, t in enumerate(texts, start=1))
+
+    return f"""{prompt_preamble(target_lang, target_code)}
+{instruction_text}
 Please translate the following English text into {target_lang}:
 
 
-{text}"""
+{segments}"""
+
+
+async def ollama_generate_batch(cfg: OllamaConfig, items: List[Tuple[str, str]], target_lang: str, target_code: str) -> List[str]:
+    """Translate (key, text) items in one request. Returns outputs aligned with items ("" if a segment is missing)."""
+    prompt = build_batch_prompt([text for _, text in items], target_lang, target_code)
+    # The response holds one translation per item, so allow the per-string timeout for each of them
+    out = await ollama_generate(cfg, prompt, timeout_s=cfg.timeout_s * len(items))
+
+    by_index: Dict[int, str] = {}
+    for idx, segment in BATCH_ITEM_RE.findall(out):
+        by_index.setdefault(int(idx), segment.strip())
+    return [by_index.get(i, "") for i in range(1, len(items) + 1)]
+
+
+@functools.lru_cache(maxsize=4096)
+def _name_pattern(name: str) -> "re.Pattern[str]":
+    """Compiled pattern matching {name} or the {name, ...} ICU header."""
+    return re.compile(r"\{" + re.escape(name) + r"(?:\}|\s*,)")
 
 
 def validate_preserved_tokens(src: str, out: str) -> Tuple[bool, Optional[str]]:
@@ -181,8 +525,14 @@ def validate_preserved_tokens(src: str, out: str) -> Tuple[bool, Optional[str]]:
     src_names = extract_placeholder_names(src)
 
     for name in src_names:
-        pattern = r"\{" + re.escape(name) + r"(?:\}|\s*,)"
-        if not re.search(pattern, out):
+        token = "{" + name
+        i = out.find(token)
+        if i == -1:
+            return False, f"Missing placeholder: {{{name}}}"
+        # Usually the first occurrence is already {name} or {name,...; only otherwise fall back to the regex
+        if out.startswith(("}", ","), i + len(token)):
+            continue
+        if not _name_pattern(name).search(out, i):
             return False, f"Missing placeholder: {{{name}}}"
 
     if has_icu_block(src) and not has_icu_block(out):
@@ -191,7 +541,7 @@ def validate_preserved_tokens(src: str, out: str) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
-def translate_one(
+async def translate_one(
     key: str,
     text: str,
     target_lang: str,
@@ -200,8 +550,11 @@ def translate_one(
     retries: int,
     backoff_s: float,
     fallback_cfg: Optional[OllamaConfig] = None,
+    cache: Optional[TranslationCache] = None,
 ) -> Tuple[str, str, Optional[str], bool]:
     """Translate a single string. Returns (key, translated_text, error_or_none, used_fallback)."""
+    cache_key = TranslationCache.make_key(cfg.model, target_lang, target_code, text) if cache else None
+
     placeholder_names = extract_placeholder_names(text)
     text_has_icu = has_icu_block(text)
     prompt = build_prompt(text, target_lang, target_code, placeholder_names, text_has_icu)
@@ -209,31 +562,37 @@ def translate_one(
     last_err: Optional[str] = None
     for attempt in range(retries + 1):
         try:
-            out = ollama_generate(cfg, prompt)
+            out = await ollama_generate(cfg, prompt)
 
             # Validate placeholders
             ok, why = validate_preserved_tokens(text, out)
             if not ok:
                 last_err = f"Validation failed: {why}"
                 if attempt < retries:
-                    time.sleep(backoff_s * (attempt + 1))
+                    await asyncio.sleep(backoff_delay(backoff_s, attempt))
                     continue
                 raise ValueError(last_err)
 
+            if cache and cache_key:
+                cache.put(cache_key, out)
             return key, out, None, False
 
+        except CircuitOpenError as e:
+            # Retrying before the cooldown ends would only fail fast again
+            last_err = str(e)
+            break
         except Exception as e:
             last_err = str(e)
             if attempt < retries:
-                time.sleep(backoff_s * (attempt + 1))
+                await asyncio.sleep(backoff_delay(backoff_s, attempt))
                 continue
 
     # Try fallback model if available
     if fallback_cfg:
         try:
-            fallback_prompt = build_prompt(text, target_lang, target_code, placeholder_names, text_has_icu)
-            fallback_out = ollama_generate(fallback_cfg, fallback_prompt)
+            fallback_out = await ollama_generate(fallback_cfg, prompt)
             fallback_ok, _ = validate_preserved_tokens(text, fallback_out)
+            # Not cached: the cache holds primary-model results, and later runs should retry the primary model
             if fallback_ok:
                 return key, fallback_out, None, True
         except Exception:
@@ -243,22 +602,80 @@ def translate_one(
     return key, text, last_err, False
 
 
+async def translate_batch(
+    items: List[Tuple[str, str]],
+    target_lang: str,
+    target_code: str,
+    cfg: OllamaConfig,
+    retries: int,
+    backoff_s: float,
+    fallback_cfg: Optional[OllamaConfig] = None,
+    cache: Optional[TranslationCache] = None,
+) -> Tuple[List[Tuple[str, str, Optional[str], bool]], List[Tuple[str, str]]]:
+    """Translate several strings with one request. Returns (results, items to retry individually with translate_one)."""
+    results: List[Tuple[str, str, Optional[str], bool]] = []
+    retry_items: List[Tuple[str, str]] = items
+    if len(items) > 1:
+        retry_items = []
+        try:
+            outputs = await ollama_generate_batch(cfg, items, target_lang, target_code)
+        except Exception:
+            outputs = [""] * len(items)
+
+        for (k, v), out in zip(items, outputs):
+            ok, _ = validate_preserved_tokens(v, out) if out else (False, None)
+            if not ok:
+                retry_items.append((k, v))
+                continue
+            if cache:
+                cache.put(TranslationCache.make_key(cfg.model, target_lang, target_code, v), out)
+            results.append((k, out, None, False))
+
+    return results, retry_items
+
+
 def is_translatable_entry(key: str, value: Any) -> bool:
     """Check if an entry should be translated."""
-    if key == "@@locale" or key.startswith("@") or key in SKIP_KEYS:
+    if key.startswith("@") or key in SKIP_KEYS:
         return False
     return isinstance(value, str) and value.strip() != ""
 
 
-def find_missing_keys(source_data: Dict[str, Any], target_data: Dict[str, Any]) -> List[str]:
-    """Find keys that are missing or empty in target."""
-    missing = []
-    for key in source_data:
-        if key == "@@locale" or key.startswith("@"):
+@dataclass
+class Buckets:
+    """Source entries sorted by how they get their translation, from a single pass over the source."""
+    missing: List[str]                     # Keys missing or empty in target (only with missing_only)
+    manual: List[Tuple[str, str]]          # (key, manual translation)
+    trivial: List[Tuple[str, str]]         # (key, source text) copied verbatim
+    to_translate: List[Tuple[str, str]]    # (key, source text) sent to the model
+
+
+def classify(source_data: Dict[str, Any], target_data: Dict[str, Any], target_locale: str, missing_only: bool) -> Buckets:
+    """Sort source entries into buckets; with missing_only, entries already translated in target are left out."""
+    buckets = Buckets(missing=[], manual=[], trivial=[], to_translate=[])
+    manual_flat = MANUAL_TRANSLATIONS_FLAT
+
+    for k, v in source_data.items():
+        if k.startswith("@"):
+            continue
+        if missing_only:
+            existing = target_data.get(k)
+            if k in target_data and not (isinstance(existing, str) and existing.strip() == ""):
+                continue
+            buckets.missing.append(k)
+        if not is_translatable_entry(k, v):
             continue
-        if key not in target_data or (isinstance(target_data.get(key), str) and target_data[key].strip() == ""):
-            missing.append(key)
-    return missing
+
+        manual = manual_flat.get((k, target_locale))
+        if manual is not None:
+            buckets.manual.append((k, manual))
+        elif is_trivial(v):
+            # Nothing to translate (placeholders, numbers, symbols)
+            buckets.trivial.append((k, v))
+        else:
+            buckets.to_translate.append((k, v))
+
+    return buckets
 
 
 def get_all_locale_files(l10n_dir: str, template_file: str) -> List[Tuple[str, str]]:
@@ -266,15 +683,24 @@ def get_all_locale_files(l10n_dir: str, template_file: str) -> List[Tuple[str, s
     locales = []
     template_basename = os.path.basename(template_file)
 
-    for filename in os.listdir(l10n_dir):
-        if filename.endswith('.arb') and filename != template_basename:
-            if filename.startswith('app_'):
-                locale = filename[4:-4]  # app_es.arb -> es
-                locales.append((locale, os.path.join(l10n_dir, filename)))
+    with os.scandir(l10n_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name.endswith('.arb') and name != template_basename and name.startswith('app_') and entry.is_file():
+                locales.append((name[4:-4], entry.path))  # app_es.arb -> es
 
     return sorted(locales)
 
 
+def write_arb(path: str, data: Dict[str, Any]) -> None:
+    """Write ARB JSON via a .partial temp file so an interrupted write never truncates the target."""
+    # A leftover .partial can only be a write cut short by a crash, so nothing reads it back
+    partial_path = path + PARTIAL_SUFFIX
+    with open(partial_path, "wb") as f:
+        f.write(json_dumps_arb(data))
+    os.replace(partial_path, path)
+
+
 def fmt_duration(seconds: float) -> str:
     """Format duration as human-readable string."""
     if seconds < 60:
@@ -288,143 +714,234 @@ def fmt_duration(seconds: float) -> str:
     return f"{h}h {m2}m"
 
 
-def translate_locale(
+async def translate_locale(
     source_data: Dict[str, Any],
     target_data: Dict[str, Any],
     target_locale: str,
     target_lang: str,
     target_code: str,
     out_path: str,
+    cfg: OllamaConfig,
+    fallback_cfg: Optional[OllamaConfig],
     args,
-    missing_keys: Optional[List[str]] = None,
+    buckets: Buckets,
+    cache: Optional[TranslationCache] = None,
+    log_prefix: str = "",
 ) -> int:
     """Translate a single locale. Returns number of strings translated."""
 
-    cfg = OllamaConfig(
-        host=args.host,
-        model=args.model,
-        timeout_s=args.timeout,
-        temperature=args.temperature,
-    )
+    # Only changed entries are collected; the full output is merged onto target or source data when written
+    base_data = target_data if target_data else source_data
+    overrides: Dict[str, Any] = {}
+    # Failed items keep their English text in the final output only
+    untranslated: Dict[str, Any] = {}
 
-    fallback_cfg = None
-    if args.fallback_model:
-        fallback_cfg = OllamaConfig(
-            host=args.host,
-            model=args.fallback_model,
-            timeout_s=args.timeout,
-            temperature=args.temperature,
-        )
+    def merged_output() -> Dict[str, Any]:
+        return {**base_data, **untranslated, **overrides, "@@locale": target_locale}
 
-    # Start with target data or source data
-    out_data: Dict[str, Any] = dict(target_data) if target_data else dict(source_data)
-    out_data["@@locale"] = target_locale
-
-    # Build list of items to translate
-    if missing_keys is not None:
-        items: List[Tuple[str, str]] = [
-            (k, source_data[k]) for k in missing_keys
-            if is_translatable_entry(k, source_data.get(k))
-        ]
-        # Copy metadata for missing items
-        for key in missing_keys:
-            meta_key = f"@{key}"
-            if meta_key in source_data:
-                out_data[meta_key] = source_data[meta_key]
-    else:
-        items: List[Tuple[str, str]] = [(k, v) for k, v in source_data.items() if is_translatable_entry(k, v)]
-
-    # Apply manual translations
-    manual_count = 0
-    items_to_translate: List[Tuple[str, str]] = []
-    for k, v in items:
-        if k in MANUAL_TRANSLATIONS and target_locale in MANUAL_TRANSLATIONS[k]:
-            out_data[k] = MANUAL_TRANSLATIONS[k][target_locale]
-            manual_count += 1
-        else:
-            items_to_translate.append((k, v))
+    # Checkpoints layer completed entries over what is already on disk, so an interrupted run never
+    # loses existing translations (in full mode target_data is empty even if the out file exists)
+    checkpoint_base = target_data
+    if not checkpoint_base and args.checkpoint_every > 0 and not args.dry_run and os.path.exists(out_path):
+        try:
+            checkpoint_base = read_json_file(out_path)
+        except Exception as e:
+            print(f"{log_prefix}Ignoring unreadable {out_path} for checkpoints: {e}", file=sys.stderr)
+        if not isinstance(checkpoint_base, dict):
+            checkpoint_base = {}
+
+    def checkpoint_output() -> Dict[str, Any]:
+        # Completed entries only: pending or failed keys must stay missing so a --missing-only rerun resumes them.
+        # Source metadata comes along with each completed key, since the rerun only copies it for missing keys
+        data = dict(checkpoint_base)
+        for k, v in overrides.items():
+            data[k] = v
+            meta_key = f"@{k}"
+            if meta_key not in data and meta_key in source_data:
+                data[meta_key] = source_data[meta_key]
+        data["@@locale"] = target_locale
+        return data
+
+    def write_output(translated_count: int) -> int:
+        if args.dry_run:
+            print(f"{log_prefix}Dry run: not writing output file.")
+            return translated_count
+
+        try:
+            write_arb(out_path, merged_output())
+        except Exception as e:
+            print(f"{log_prefix}Failed to write output: {e}", file=sys.stderr)
+            return -1
+
+        print(f"{log_prefix}Wrote: {out_path}")
+        return translated_count
+
+    # Copy metadata for missing items
+    for k in buckets.missing:
+        meta_key = f"@{k}"
+        if meta_key in source_data:
+            overrides[meta_key] = source_data[meta_key]
+
+    overrides.update(buckets.manual)
+    overrides.update(buckets.trivial)
+    manual_count = len(buckets.manual)
+    trivial_count = len(buckets.trivial)
+    items_to_translate = buckets.to_translate
 
     if manual_count > 0:
-        print(f"Applied {manual_count} manual translation(s)")
+        print(f"{log_prefix}Applied {manual_count} manual translation(s)")
+
+    if trivial_count > 0:
+        print(f"{log_prefix}Copied {trivial_count} non-translatable string(s) verbatim")
 
     total = len(items_to_translate)
     if total == 0:
-        if manual_count > 0:
-            print("All strings handled by manual translations.")
-        return manual_count
+        if manual_count > 0 or trivial_count > 0:
+            print(f"{log_prefix}All strings handled by manual translations or verbatim copies.")
+        # Nothing for the model, but manual, verbatim and metadata entries still need writing
+        return write_output(manual_count + trivial_count)
+
+    # Translate each distinct source text once and fan the result out to every key using it
+    unique: Dict[str, List[str]] = {}
+    for k, v in items_to_translate:
+        unique.setdefault(v, []).append(k)
 
     fallback_info = f" (fallback: {args.fallback_model})" if args.fallback_model else ""
-    print(f"Translating {total} strings -> {target_lang} using {cfg.model}{fallback_info} (concurrency={args.concurrency})")
+    print(f"{log_prefix}Translating {total} strings ({len(unique)} unique) -> {target_lang} using {cfg.model}{fallback_info} (concurrency={args.concurrency}, batch_size={args.batch_size})")
 
-    start = time.time()
+    start = time.monotonic()
     failures: List[Tuple[str, str]] = []
-    translated_ok = manual_count
+    translated_ok = manual_count + trivial_count
     fallback_used = 0
     completed = 0
 
-    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as ex:
-        future_to_key = {
-            ex.submit(
-                translate_one,
-                key=k,
-                text=v,
+    # Completion times and running key counts, one slot per unique text, for a windowed ETA
+    done_ts = array.array("d", [0.0]) * len(unique)
+    done_keys = array.array("q", [0]) * len(unique)
+    done_idx = 0
+    last_print = float("-inf")
+
+    # Resolve cache hits up front, so only uncached texts are batched and a fully cached run sends no requests.
+    # The source text doubles as the item key so results can be mapped back to their key group
+    cached_results: List[Tuple[str, str, Optional[str], bool]] = []
+    uncached_items: List[Tuple[str, str]] = []
+    for v in unique:
+        hit = cache.get(TranslationCache.make_key(cfg.model, target_lang, target_code, v)) if cache else None
+        if hit is not None:
+            cached_results.append((v, hit, None, False))
+        else:
+            uncached_items.append((v, v))
+    batch_size = max(1, args.batch_size)
+    batches = [uncached_items[i:i + batch_size] for i in range(0, len(uncached_items), batch_size)]
+
+    sem = asyncio.Semaphore(max(1, args.concurrency))
+
+    async def run_batch(batch: List[Tuple[str, str]]) -> Tuple[List[Tuple[str, str, Optional[str], bool]], List[Tuple[str, str]]]:
+        async with sem:
+            return await translate_batch(
+                items=batch,
                 target_lang=target_lang,
                 target_code=target_code,
                 cfg=cfg,
                 retries=args.retries,
                 backoff_s=args.backoff,
                 fallback_cfg=fallback_cfg,
-            ): k
-            for (k, v) in items_to_translate
-        }
-
-        for fut in as_completed(future_to_key):
-            k, translated, err, used_fallback = fut.result()
-            out_data[k] = translated
+                cache=cache,
+            )
 
-            completed += 1
+    async def run_one(key: str, text: str) -> Tuple[List[Tuple[str, str, Optional[str], bool]], List[Tuple[str, str]]]:
+        async with sem:
+            result = await translate_one(
+                key=key,
+                text=text,
+                target_lang=target_lang,
+                target_code=target_code,
+                cfg=cfg,
+                retries=args.retries,
+                backoff_s=args.backoff,
+                fallback_cfg=fallback_cfg,
+                cache=cache,
+            )
+        return [result], []
+
+    async def completed_results() -> AsyncIterator[List[Tuple[str, str, Optional[str], bool]]]:
+        if cached_results:
+            yield cached_results
+        pending = {asyncio.create_task(run_batch(batch)) for batch in batches}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for fut in done:
+                results, retry_items = fut.result()
+                # Items a batch couldn't translate get their own tasks, so retries run concurrently too
+                pending.update(asyncio.create_task(run_one(k, v)) for k, v in retry_items)
+                yield results
+
+    # Load the model and seed its prompt cache with the shared preamble before the workers fan out,
+    # so concurrent first requests don't each wait on (or trigger) a cold model load. Skipped when
+    # everything came from the cache, so a fully cached run doesn't load the model at all
+    if batches:
+        try:
+            await ollama_generate(cfg, prompt_preamble(target_lang, target_code), max_tokens=1)
+        except Exception as e:
+            print(f"{log_prefix}Prompt cache warm-up failed: {e}", file=sys.stderr)
+
+    async for results in completed_results():
+        for text, translated, err, used_fallback in results:
+            keys = unique[text]
+            dest = untranslated if err else overrides
+            for k in keys:
+                dest[k] = translated
+
+            prev_completed = completed
+            completed += len(keys)
+            now = time.monotonic()
+            done_ts[done_idx] = now
+            done_keys[done_idx] = completed
+            done_idx += 1
+            k = keys[0] if len(keys) == 1 else f"{keys[0]} (+{len(keys) - 1} duplicate(s))"
             if err:
                 failures.append((k, err))
                 status = "FAIL"
             else:
-                translated_ok += 1
+                translated_ok += len(keys)
                 if used_fallback:
-                    fallback_used += 1
+                    fallback_used += len(keys)
                     status = "OK*"
                 else:
                     status = "OK"
 
-            if completed % args.progress_every == 0 or completed == total:
-                elapsed = time.time() - start
-                rate = completed / elapsed if elapsed > 0 else 0.0
+            crossed = completed // args.progress_every != prev_completed // args.progress_every
+            if (crossed and now - last_print >= PROGRESS_MIN_INTERVAL_S) or completed == total:
+                last_print = now
+                elapsed = now - start
+                # Rate over recent completions follows throughput changes better than the overall mean
+                first = done_idx - 1 - PROGRESS_RATE_WINDOW
+                window_s = now - (done_ts[first] if first >= 0 else start)
+                window_keys = completed - (done_keys[first] if first >= 0 else 0)
+                rate = window_keys / window_s if window_s > 0 else 0.0
                 remaining = (total - completed) / rate if rate > 0 else 0.0
-                print(f"[{completed:>4}/{total}] {status:<4} {k} | elapsed {fmt_duration(elapsed)} | ETA {fmt_duration(remaining)}")
+                print(f"{log_prefix}[{completed:>4}/{total}] {status:<4} {k} | elapsed {fmt_duration(elapsed)} | ETA {fmt_duration(remaining)}")
+
+            # Checkpoint progress so an interrupted run keeps what it already translated
+            every = args.checkpoint_every
+            if every > 0 and not args.dry_run and completed < total and completed // every != prev_completed // every:
+                try:
+                    write_arb(out_path, checkpoint_output())
+                except Exception as e:
+                    print(f"{log_prefix}Failed to write checkpoint: {e}", file=sys.stderr)
 
-    elapsed = time.time() - start
+    elapsed = time.monotonic() - start
     fallback_msg = f", fallback_used={fallback_used}" if fallback_used > 0 else ""
-    print(f"Done in {fmt_duration(elapsed)}. OK={translated_ok}{fallback_msg}, errors={len(failures)}")
+    print(f"{log_prefix}Done in {fmt_duration(elapsed)}. OK={translated_ok}{fallback_msg}, errors={len(failures)}")
 
     if failures:
-        print(f"{len(failures)} translation(s) kept original English:")
+        print(f"{log_prefix}{len(failures)} translation(s) kept original English:")
         for k, err in failures[:20]:
-            print(f" - {k}: {err}")
+            print(f"{log_prefix} - {k}: {err}")
         if len(failures) > 20:
-            print(f" ... and {len(failures) - 20} more")
+            print(f"{log_prefix} ... and {len(failures) - 20} more")
 
-    if args.dry_run:
-        print("Dry run: not writing output file.")
-        return translated_ok
-
-    try:
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(out_data, f, ensure_ascii=False, indent=2)
-            f.write("\n")
-    except Exception as e:
-        print(f"Failed to write output: {e}", file=sys.stderr)
-        return -1
-
-    print(f"Wrote: {out_path}")
-    return translated_ok
+    return write_output(translated_ok)
 
 
 def main() -> int:
@@ -437,19 +954,23 @@ def main() -> int:
     ap.add_argument("--model", default="translategemma:latest", help="Ollama model (translategemma:latest or specific versions)")
     ap.add_argument("--fallback-model", help="Fallback model for failed translations (e.g., translategemma:27b)")
     ap.add_argument("--host", default="http://localhost:11434", help="Ollama host")
+    ap.add_argument("--keep-alive", type=parse_keep_alive, default="30m", help="How long Ollama keeps models loaded between requests (e.g. 30m, -1 for forever)")
     ap.add_argument("--timeout", type=float, default=120.0, help="HTTP timeout seconds")
     ap.add_argument("--temperature", type=float, default=0.0, help="Model temperature (0.0 for deterministic)")
     ap.add_argument("--concurrency", type=int, default=4, help="Parallel requests")
+    ap.add_argument("--locale-concurrency", type=int, default=2, help="Locales translated in parallel with --l10n-dir")
+    ap.add_argument("--batch-size", type=int, default=16, help="Strings per request (1 disables batching)")
     ap.add_argument("--retries", type=int, default=2, help="Retries per string")
     ap.add_argument("--backoff", type=float, default=0.6, help="Backoff seconds base")
     ap.add_argument("--dry-run", action="store_true", help="Don't write output")
-    ap.add_argument("--progress-every", type=int, default=1, help="Print progress every N strings")
+    ap.add_argument("--progress-every", type=int, default=1, help="Print progress every N strings (at most twice a second)")
+    ap.add_argument("--checkpoint-every", type=int, default=50, help="Write partial output every N strings (0 disables)")
+    ap.add_argument("--cache-path", default=".translate_cache.sqlite", help="Translation cache file (empty string disables caching)")
     args = ap.parse_args()
 
     # Read source file
     try:
-        with open(args.in_path, "r", encoding="utf-8") as f:
-            source_data = json.load(f)
+        source_data = read_json_file(args.in_path)
     except Exception as e:
         print(f"Failed to read input: {e}", file=sys.stderr)
         return 2
@@ -458,6 +979,28 @@ def main() -> int:
         print("Input JSON must be an object at top-level.", file=sys.stderr)
         return 2
 
+    cache: Optional[TranslationCache] = None
+    if args.cache_path:
+        try:
+            cache = TranslationCache(args.cache_path)
+        except sqlite3.Error as e:
+            print(f"Failed to open cache {args.cache_path}: {e} (continuing without cache)", file=sys.stderr)
+
+    try:
+        return asyncio.run(run(args, source_data, cache))
+    finally:
+        if cache:
+            cache.close()
+
+
+async def run(args, source_data: Dict[str, Any], cache: Optional[TranslationCache]) -> int:
+    """Translate either every locale in --l10n-dir or the single --out/--to-locale target."""
+    # Built once and shared by every locale
+    cfg, fallback_cfg = ollama_configs(args)
+    # One worker thread per in-flight request; the default pool may be smaller than --concurrency allows
+    max_workers = max(1, args.concurrency) * (max(1, args.locale_concurrency) if args.l10n_dir else 1)
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=max_workers))
+
     # Process all locales if --l10n-dir is provided
     if args.l10n_dir:
         locales = get_all_locale_files(args.l10n_dir, args.in_path)
@@ -467,37 +1010,43 @@ def main() -> int:
 
         print(f"Found {len(locales)} locale file(s) to process")
 
-        total_translated = 0
-        for locale_code, locale_path in locales:
-            lang_name, lang_code = LOCALE_MAP.get(locale_code, (locale_code, locale_code))
-
-            try:
-                with open(locale_path, "r", encoding="utf-8") as f:
-                    target_data = json.load(f)
-            except Exception as e:
-                print(f"  [{locale_code}] Failed to read {locale_path}: {e}")
-                continue
-
-            if args.missing_only:
-                missing_keys = find_missing_keys(source_data, target_data)
-                if not missing_keys:
-                    print(f"  [{locale_code}] No missing keys")
-                    continue
-                print(f"  [{locale_code}] {len(missing_keys)} missing key(s)")
-            else:
-                missing_keys = None
-
-            result = translate_locale(
-                source_data=source_data,
-                target_data=target_data,
-                target_locale=locale_code,
-                target_lang=lang_name,
-                target_code=lang_code,
-                out_path=locale_path,
-                args=args,
-                missing_keys=missing_keys,
-            )
-            total_translated += result
+        # Translate several locales at once; each one still runs up to --concurrency requests
+        locale_sem = asyncio.Semaphore(max(1, args.locale_concurrency))
+
+        async def process_locale(locale_code: str, locale_path: str) -> int:
+            async with locale_sem:
+                lang_name, lang_code = LOCALE_MAP.get(locale_code, (locale_code, locale_code))
+
+                try:
+                    target_data = read_json_file(locale_path)
+                except Exception as e:
+                    print(f"  [{locale_code}] Failed to read {locale_path}: {e}")
+                    return 0
+
+                buckets = classify(source_data, target_data, locale_code, args.missing_only)
+                if args.missing_only:
+                    if not buckets.missing:
+                        print(f"  [{locale_code}] No missing keys")
+                        return 0
+                    print(f"  [{locale_code}] {len(buckets.missing)} missing key(s)")
+
+                return await translate_locale(
+                    source_data=source_data,
+                    target_data=target_data,
+                    target_locale=locale_code,
+                    target_lang=lang_name,
+                    target_code=lang_code,
+                    out_path=locale_path,
+                    cfg=cfg,
+                    fallback_cfg=fallback_cfg,
+                    args=args,
+                    buckets=buckets,
+                    cache=cache,
+                    log_prefix=f"  [{locale_code}] ",
+                )
+
+        results = await asyncio.gather(*(process_locale(code, path) for code, path in locales))
+        total_translated = sum(results)
 
         print(f"\nTotal: {total_translated} string(s) translated across {len(locales)} locale(s)")
         return 0
@@ -511,29 +1060,33 @@ def main() -> int:
 
     # Read existing target file if --missing-only
     target_data: Dict[str, Any] = {}
-    missing_keys: Optional[List[str]] = None
-    if args.missing_only and os.path.exists(args.out_path):
+    missing_only = args.missing_only and os.path.exists(args.out_path)
+    if missing_only:
         try:
-            with open(args.out_path, "r", encoding="utf-8") as f:
-                target_data = json.load(f)
-            missing_keys = find_missing_keys(source_data, target_data)
-            if not missing_keys:
-                print(f"No missing keys in {args.out_path}")
-                return 0
-            print(f"Found {len(missing_keys)} missing key(s) to translate")
+            target_data = read_json_file(args.out_path)
         except Exception as e:
             print(f"Failed to read target file: {e}", file=sys.stderr)
             return 2
 
-    result = translate_locale(
+    buckets = classify(source_data, target_data, args.to_locale, missing_only)
+    if missing_only:
+        if not buckets.missing:
+            print(f"No missing keys in {args.out_path}")
+            return 0
+        print(f"Found {len(buckets.missing)} missing key(s) to translate")
+
+    result = await translate_locale(
         source_data=source_data,
         target_data=target_data,
         target_locale=args.to_locale,
         target_lang=lang_name,
         target_code=lang_code,
         out_path=args.out_path,
+        cfg=cfg,
+        fallback_cfg=fallback_cfg,
         args=args,
-        missing_keys=missing_keys,
+        buckets=buckets,
+        cache=cache,
     )
     return 0 if result >= 0 else 1
 